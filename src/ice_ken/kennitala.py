@@ -25,8 +25,10 @@ This module provides:
 import calendar
 from dataclasses import dataclass
 from datetime import date
-from typing import Literal
+import itertools
+from typing import Iterable, Literal
 import random
+import sys
 
 __all__ = [
     "ParsedKennitala",
@@ -50,7 +52,12 @@ __all__ = [
 ]
 
 
-@dataclass(frozen=True, repr=False)
+# Slotted instances have no per-instance __dict__; dataclass(slots=...)
+# exists from Python 3.10, older versions keep the regular layout.
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, repr=False, **_DATACLASS_SLOTS)
 class ParsedKennitala:
     """Structured representation of a parsed kennitala.
 
@@ -84,6 +91,11 @@ class ParsedKennitala:
         )
 
 
+# Deletes the separators accepted by normalize(); anything else left over
+# after translation is rejected.
+_SEPARATOR_TABLE = str.maketrans("", "", " \t-")
+
+
 def normalize(value: str) -> str:
     """Return only the digits of a kennitala.
 
@@ -104,12 +116,23 @@ def normalize(value: str) -> str:
     """
     if not isinstance(value, str):
         raise TypeError(f"Expected str, got {type(value).__name__}")
-    for ch in value:
-        if not ("0" <= ch <= "9" or ch in " \t-"):
-            raise ValueError(
-                f"Unexpected character {ch!r} in kennitala string"
-            )
-    return "".join(ch for ch in value if "0" <= ch <= "9")
+    # Fast paths for the two common shapes: already-clean digits (returned
+    # as is) and the formatted "DDMMYY-NNNX" form (hyphen sliced out).
+    n = len(value)
+    if n == 10 and value.isascii() and value.isdigit():
+        return value
+    if n == 11 and value[6] == "-":
+        digits = value[:6] + value[7:]
+        if digits.isascii() and digits.isdigit():
+            return digits
+    digits = value.translate(_SEPARATOR_TABLE)
+    if digits and not (digits.isascii() and digits.isdigit()):
+        for ch in digits:
+            if not "0" <= ch <= "9":
+                raise ValueError(
+                    f"Unexpected character {ch!r} in kennitala string"
+                )
+    return digits
 
 
 def format_kennitala(value: str) -> str:
@@ -123,63 +146,28 @@ def format_kennitala(value: str) -> str:
     return f"{digits[0:6]}-{digits[6:10]}"
 
 
-def _century_base(indicator: int) -> int | None:
-    if indicator == 8:
-        return 1800
-    if indicator == 9:
-        return 1900
-    if indicator == 0:
-        return 2000
-    return None
+# Modulus 11 weights for the first 8 digits.
+_WEIGHTS = (3, 2, 7, 6, 5, 4, 3, 2)
 
+# Check digit indexed by ``weighted_sum % 11``; 10 marks an impossible
+# check digit (no valid kennitala exists for that prefix).
+_CHECK_FROM_REMAINDER = (0, 10, 9, 8, 7, 6, 5, 4, 3, 2, 1)
 
-def _resolve_birth_date(digits: str) -> date | None:
-    # digits: 10-digit kennitala (digits only)
-    day_raw = int(digits[0:2])
-    # Company IDs have day offset +40
-    is_company = 41 <= day_raw <= 71
-    day = day_raw - 40 if is_company else day_raw
-    month = int(digits[2:4])
-    year_two = int(digits[4:6])
-    century = _century_base(int(digits[9]))
-    if century is None:
-        return None
-    full_year = century + year_two
-    try:
-        return date(full_year, month, day)
-    except ValueError:
-        # Company kennitölur registered on Feb 28 of a non-leap year
-        # exhaust DD=68 and reuse 69/70/71 as overflow slots, decoding
-        # past month-end. Clamp to the last day of February. Confirmed
-        # against the official registry for 6902690159, 7102695569,
-        # 7102690339, 7102696379 (all 1969-02-28). Extension to other
-        # short months is unverified — leave them failing for now.
-        if is_company and month == 2:
-            last_day = calendar.monthrange(full_year, month)[1]
-            if day > last_day:
-                return date(full_year, month, last_day)
-        return None
 
+# Per-position ``digit * weight`` products indexed by the digit's ASCII
+# code, so the weighted sum is eight table lookups with no arithmetic.
+_W0, _W1, _W2, _W3, _W4, _W5, _W6, _W7 = (
+    tuple((code - 48) * w if code >= 48 else 0 for code in range(58))
+    for w in _WEIGHTS
+)
 
-def _is_company_digits(digits: str) -> bool:
-    if len(digits) != 10 or not digits.isdigit():
-        return False
-    dd = int(digits[0:2])
-    return 41 <= dd <= 71
-
-
-def _checksum_ok(digits: str) -> bool:
-    # Checksum uses the first 8 digits and weights [3,2,7,6,5,4,3,2]
-    weights = [3, 2, 7, 6, 5, 4, 3, 2]
-    total = sum(int(d) * w for d, w in zip(digits[:8], weights))
-    remainder = total % 11
-    check = 11 - remainder
-    if check == 11:
-        check = 0
-    if check == 10:
-        # 10 indicates invalid kennitala
-        return False
-    return check == int(digits[8])
+
+def _weighted_sum(b: bytes) -> int:
+    # b: at least 8 ASCII digit bytes
+    return (
+        _W0[b[0]] + _W1[b[1]] + _W2[b[2]] + _W3[b[3]]
+        + _W4[b[4]] + _W5[b[5]] + _W6[b[6]] + _W7[b[7]]
+    )
 
 
 def _compute_checksum_for_first8(first8: str) -> int | None:
@@ -187,15 +175,53 @@ def _compute_checksum_for_first8(first8: str) -> int | None:
 
     Returns an int 0-9, or None if the result is 10 (invalid by definition).
     """
-    weights = [3, 2, 7, 6, 5, 4, 3, 2]
-    total = sum(int(d) * w for d, w in zip(first8, weights))
-    remainder = total % 11
-    check = 11 - remainder
-    if check == 11:
-        return 0
-    if check == 10:
-        return None
-    return check
+    check = _CHECK_FROM_REMAINDER[_weighted_sum(first8.encode("ascii")) % 11]
+    return None if check == 10 else check
+
+
+# Days per month (index 1-12) in a non-leap year.
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# Century base year indexed by the century indicator (10th digit).
+_CENTURY_BASE = (2000, None, None, None, None, None, None, None, 1800, 1900)
+
+
+def _full_parse(digits: str) -> tuple[date | None, bool, bool]:
+    """Decode a normalized 10-digit kennitala in a single pass.
+
+    Returns ``(birth_date, is_company, checksum_ok)``. ``birth_date`` is
+    None when the century indicator or the encoded date is invalid.
+    """
+    b = digits.encode("ascii")
+    day_raw = (b[0] - 48) * 10 + (b[1] - 48)
+    # Company IDs have day offset +40
+    is_company = 41 <= day_raw <= 71
+    check = _CHECK_FROM_REMAINDER[_weighted_sum(b) % 11]
+    checksum_ok = check != 10 and check == b[8] - 48
+    century = _CENTURY_BASE[b[9] - 48]
+    if century is None:
+        return None, is_company, checksum_ok
+    day = day_raw - 40 if is_company else day_raw
+    month = (b[2] - 48) * 10 + (b[3] - 48)
+    full_year = century + (b[4] - 48) * 10 + (b[5] - 48)
+    # Check against the month length up front so invalid dates never go
+    # through date()'s exception path.
+    if not 1 <= month <= 12 or day < 1:
+        return None, is_company, checksum_ok
+    last_day = _DAYS_IN_MONTH[month]
+    if month == 2 and calendar.isleap(full_year):
+        last_day = 29
+    if day > last_day:
+        # Company kennitölur registered on Feb 28 of a non-leap year
+        # exhaust DD=68 and reuse 69/70/71 as overflow slots, decoding
+        # past month-end. Clamp to the last day of February. Confirmed
+        # against the official registry for 6902690159, 7102695569,
+        # 7102690339, 7102696379 (all 1969-02-28). Extension to other
+        # short months is unverified — leave them failing for now.
+        if not (is_company and month == 2):
+            return None, is_company, checksum_ok
+        day = last_day
+    return date(full_year, month, day), is_company, checksum_ok
 
 
 def is_valid(value: str, enforce_checksum: bool = False) -> bool:
@@ -225,14 +251,27 @@ def is_valid(value: str, enforce_checksum: bool = False) -> bool:
         return False
     if len(digits) != 10:
         return False
-    # Valid century indicator (10th digit)
-    if _century_base(int(digits[9])) is None:
-        return False
-    # Valid birth/registration date (handles company day offset)
-    if _resolve_birth_date(digits) is None:
+    # Century indicator, birth/registration date (handles company day
+    # offset) and checksum, decoded together
+    birth, _, checksum_ok = _full_parse(digits)
+    if birth is None:
         return False
     # Checksum (conditionally enforced)
-    return _checksum_ok(digits) if enforce_checksum else True
+    return checksum_ok or not enforce_checksum
+
+
+def _parse_checked(value: str, enforce_checksum: bool) -> tuple[str, date, bool]:
+    # Shared by parse() and get_birth_date(): returns (digits, birth_date,
+    # is_company) or raises ValueError under the selected policy.
+    digits = normalize(value)
+    if len(digits) != 10:
+        raise ValueError("Kennitala must contain exactly 10 digits")
+    birth, company, checksum_ok = _full_parse(digits)
+    if birth is None:
+        raise ValueError("Invalid kennitala date or century indicator")
+    if enforce_checksum and not checksum_ok:
+        raise ValueError("Invalid kennitala checksum")
+    return digits, birth, company
 
 
 def parse(value: str, enforce_checksum: bool = False) -> ParsedKennitala:
@@ -244,24 +283,23 @@ def parse(value: str, enforce_checksum: bool = False) -> ParsedKennitala:
         Default changed from ``True`` to ``False`` to avoid rejecting
         newly issued kennitalas without valid checksums.
     """
-    digits = normalize(value)
-    if len(digits) != 10:
-        raise ValueError("Kennitala must contain exactly 10 digits")
-    birth = _resolve_birth_date(digits)
-    if birth is None:
-        raise ValueError("Invalid kennitala date or century indicator")
-    if enforce_checksum and not _checksum_ok(digits):
-        raise ValueError("Invalid kennitala checksum")
-    entity = "company" if _is_company_digits(digits) else "individual"
+    digits, birth, company = _parse_checked(value, enforce_checksum)
     return ParsedKennitala(
         digits=digits,
-        formatted=format_kennitala(digits),
+        formatted=f"{digits[0:6]}-{digits[6:10]}",
         birth_date=birth,
         century_indicator=int(digits[9]),
-        entity_type=entity,
+        entity_type="company" if company else "individual",
     )
 
 
+# Masked, hyphenated prefix for each visible_tail of 0-9; the visible
+# digits are appended as is.
+_MASKED_HEADS = tuple(
+    f"{head[0:6]}-{head[6:]}" for head in ("*" * (10 - tail) for tail in range(10))
+)
+
+
 def mask(value: str, visible_tail: int = 4) -> str:
     """Return a masked representation, exposing only the last `visible_tail` digits.
 
@@ -282,10 +320,7 @@ def mask(value: str, visible_tail: int = 4) -> str:
         raise ValueError("visible_tail must be an integer between 0 and 10")
     if visible_tail == 10:
         return format_kennitala(digits)
-    tail = digits[-visible_tail:] if visible_tail > 0 else ""
-    masked_head = "*" * (10 - len(tail))
-    masked = f"{masked_head[0:6]}-{masked_head[6:]}{tail}"
-    return masked
+    return _MASKED_HEADS[visible_tail] + digits[10 - visible_tail:]
 
 
 def is_company(value: str) -> bool:
@@ -298,7 +333,10 @@ def is_company(value: str) -> bool:
         digits = normalize(value)
     except (TypeError, ValueError):
         return False
-    return _is_company_digits(digits) and is_valid(digits, enforce_checksum=False)
+    if len(digits) != 10:
+        return False
+    birth, company, _ = _full_parse(digits)
+    return company and birth is not None
 
 
 def is_personal(value: str) -> bool:
@@ -310,9 +348,10 @@ def is_personal(value: str) -> bool:
         digits = normalize(value)
     except (TypeError, ValueError):
         return False
-    if len(digits) != 10 or not digits.isdigit():
+    if len(digits) != 10:
         return False
-    return not _is_company_digits(digits) and is_valid(digits, enforce_checksum=False)
+    birth, company, _ = _full_parse(digits)
+    return not company and birth is not None
 
 
 def is_dataset_id(value: str) -> bool:
@@ -340,14 +379,29 @@ def _random_date(start: date, end: date) -> date:
     return date.fromordinal(random.randint(start_ordinal, end_ordinal))
 
 
+# Century indicator (10th digit) keyed by ``year // 100``.
+_CENTURY_INDICATORS = {18: 8, 19: 9, 20: 0}
+
+
 def _century_indicator_for_year(year: int) -> int:
-    if 1800 <= year <= 1899:
-        return 8
-    if 1900 <= year <= 1999:
-        return 9
-    if 2000 <= year <= 2099:
-        return 0
-    raise ValueError("Year out of supported range for kennitala")
+    indicator = _CENTURY_INDICATORS.get(year // 100)
+    if indicator is None:
+        raise ValueError("Year out of supported range for kennitala")
+    return indicator
+
+
+# Zero-padded two-digit strings, so building an ID is lookups and concats.
+_TWO = tuple(f"{i:02d}" for i in range(100))
+
+# Weighted-sum contribution of each sequence number (digits 7-8).
+_SEQUENCE_WEIGHT = tuple(3 * (r // 10) + 2 * (r % 10) for r in range(100))
+
+# Sequence numbers 20-99 yielding a check digit other than 10, indexed by
+# the date digits' weighted sum mod 11.
+_SEQUENCES_BY_PREFIX = tuple(
+    tuple(r for r in range(20, 100) if (prefix + _SEQUENCE_WEIGHT[r]) % 11 != 1)
+    for prefix in range(11)
+)
 
 
 def _build_kennitala(
@@ -360,9 +414,10 @@ def _build_kennitala(
     """Core generation logic shared by all public generators.
 
     Builds a 10-digit kennitala for the given date. For company IDs the day
-    field is offset by +40. Retries with different sequence numbers until a
-    valid checksum is found (when ``enforce_checksum`` is True) or deliberately
-    avoids the correct checksum (when False).
+    field is offset by +40. When ``enforce_checksum`` is True the sequence
+    number is drawn uniformly from those whose check digit is not 10 and the
+    correct check digit is used; when False any sequence number is drawn and
+    the check digit is deliberately wrong.
 
     Uses Python's ``random`` module (Mersenne Twister), which is **not**
     cryptographically secure. Generated IDs are suitable for test fixtures
@@ -373,28 +428,26 @@ def _build_kennitala(
     yy = target_date.year % 100
     c = _century_indicator_for_year(target_date.year)
 
-    max_attempts = 1000
-    for _ in range(max_attempts):
+    # The date digits contribute a fixed amount to the weighted sum, so the
+    # usable sequence numbers are known up front and no retry is needed.
+    prefix = (
+        3 * (dd // 10) + 2 * (dd % 10)
+        + 7 * (mm // 10) + 6 * (mm % 10)
+        + 5 * (yy // 10) + 4 * (yy % 10)
+    ) % 11
+    if enforce_checksum:
+        r = random.choice(_SEQUENCES_BY_PREFIX[prefix])
+        p = _CHECK_FROM_REMAINDER[(prefix + _SEQUENCE_WEIGHT[r]) % 11]
+    else:
         r = random.randint(20, 99)
-        first8 = f"{dd:02d}{mm:02d}{yy:02d}{r:02d}"
-        if enforce_checksum:
-            chk = _compute_checksum_for_first8(first8)
-            if chk is None:
-                continue
-            p = chk
+        chk = _CHECK_FROM_REMAINDER[(prefix + _SEQUENCE_WEIGHT[r]) % 11]
+        if chk == 10:
+            p = random.randint(0, 9)
         else:
-            chk = _compute_checksum_for_first8(first8)
-            if chk is None:
-                p = random.randint(0, 9)
-            else:
-                choices = [d for d in range(10) if d != chk]
-                p = random.choice(choices)
-        digits = f"{first8}{p}{c}"
-        break
-    else:
-        raise RuntimeError(
-            f"Failed to generate kennitala after {max_attempts} attempts"
-        )
+            # Uniform over the nine digits other than chk
+            p = (chk + random.randint(1, 9)) % 10
+    # Check digit and century indicator share the last two-digit slot
+    digits = _TWO[dd] + _TWO[mm] + _TWO[yy] + _TWO[r] + _TWO[p * 10 + c]
 
     return format_kennitala(digits) if formatted else digits
 
@@ -542,11 +595,26 @@ def generate_batch(
         raise ValueError("count must be >= 0")
     if count > 100_000:
         raise ValueError("count must be <= 100000")
-    return [
-        generate_kennitala(
-            kind, target_date=effective_date, enforce_checksum=enforce_checksum, formatted=formatted,
+    # Resolve kind and the date range once, then go straight to the core
+    # generator instead of through generate_kennitala per ID.
+    if kind == "personal":
+        company, start = False, _PERSONAL_START
+    elif kind == "company":
+        company, start = True, _COMPANY_START
+    else:
+        raise ValueError(f"kind must be 'personal' or 'company', got {kind!r}")
+    if effective_date is not None:
+        dates: Iterable[date] = itertools.repeat(effective_date, count)
+    else:
+        start_ordinal = start.toordinal()
+        end_ordinal = _default_end_date().toordinal()
+        dates = (
+            date.fromordinal(random.randint(start_ordinal, end_ordinal))
+            for _ in range(count)
         )
-        for _ in range(count)
+    return [
+        _build_kennitala(d, company=company, enforce_checksum=enforce_checksum, formatted=formatted)
+        for d in dates
     ]
 
 
@@ -586,8 +654,9 @@ def random_personal(
     """
     if start > end:
         raise ValueError("Start must not be > end")
-    birth = _random_date(start, end)
-    return generate_personal(birth_date=birth, enforce_checksum=enforce_checksum, formatted=formatted)
+    return _build_kennitala(
+        _random_date(start, end), company=False, enforce_checksum=enforce_checksum, formatted=formatted,
+    )
 
 
 def random_company(
@@ -603,14 +672,15 @@ def random_company(
     """
     if start > end:
         raise ValueError("Start must not be > end")
-    reg = _random_date(start, end)
-    return generate_company(reg_date=reg, enforce_checksum=enforce_checksum, formatted=formatted)
+    return _build_kennitala(
+        _random_date(start, end), company=True, enforce_checksum=enforce_checksum, formatted=formatted,
+    )
 
 
 def get_birth_date(value: str, *, enforce_checksum: bool = False) -> date:
     """Return the resolved birth/registration date for a kennitala.
 
-    Wraps `parse()` and returns `ParsedKennitala.birth_date`.
-    Raises ValueError if invalid under the selected policy.
+    Same result as `parse(value).birth_date`, without building the
+    `ParsedKennitala`. Raises ValueError if invalid under the selected policy.
     """
-    return parse(value, enforce_checksum=enforce_checksum).birth_date
+    return _parse_checked(value, enforce_checksum)[1]
@@ -2,14 +2,15 @@ from __future__ import annotations
 
 import argparse
 import json
-import re
+import os
+import sys
 from datetime import date
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator, Protocol, TextIO, TypedDict
 import xml.etree.ElementTree as ET
 
 try:
-    from defusedxml.ElementTree import fromstring as _xml_fromstring
+    from defusedxml.ElementTree import DefusedXMLParser as _XMLParser
 except ImportError:
     import warnings as _warnings
 
@@ -22,84 +23,255 @@ except ImportError:
     # stdlib XMLParser blocks external entities (XXE) since Python 3.x, but
     # does NOT block internal entity expansion (billion laughs). Only use
     # this fallback with trusted XML input.
-    _xml_fromstring = ET.fromstring
-
-from .kennitala import is_valid, is_company, is_personal, is_dataset_id, parse, mask
+    _XMLParser = ET.XMLParser
 
+try:
+    import orjson
+except ImportError:
+    # Optional speedup only; output is identical with the stdlib json module.
+    orjson = None  # type: ignore[assignment]
 
-def _read_text(path: Path) -> str:
-    return path.read_text(encoding="utf-8")
+from .kennitala import _full_parse, mask, normalize
 
 
-def _sanitize_known_issues(xml_text: str) -> str:
-    # Fix duplicated self-closing tag pattern observed in sample
-    xml_text = re.sub(r"(<SidastaIslLogh[^>]*/>)\s*/>", r"\1", xml_text)
-    return xml_text
+_XSI_NIL = "{http://www.w3.org/2001/XMLSchema-instance}nil"
 
 
-def _is_nil(elem: ET.Element) -> bool:
-    for k, v in elem.attrib.items():
+def _is_nil(attrib: dict[str, str]) -> bool:
+    if not attrib:
+        return False
+    v = attrib.get(_XSI_NIL)
+    if v is not None:
+        return v.lower() == "true"
+    # nil in another namespace or unqualified
+    for k, v in attrib.items():
         if k.endswith("nil") and v.lower() == "true":
             return True
     return False
 
 
-def _text_or_none(elem: ET.Element) -> str | None:
-    if _is_nil(elem):
+def _text_or_none(text: str, attrib: dict[str, str]) -> str | None:
+    if _is_nil(attrib):
         return None
-    txt = (elem.text or "").strip()
-    return txt if txt != "" else None
+    # Most values are unpadded; only strip when there is something to strip
+    if text and (text[0].isspace() or text[-1].isspace()):
+        text = text.strip()
+    return text or None
 
 
-def parse_einstaklingar_xml(path: str | Path) -> list[dict[str, Any]]:
+class _EinstaklingarTarget:
+    """Parser target building record dicts directly from parse events.
+
+    No element tree is constructed: each child of an ``Einstaklingur``
+    becomes a key (namespace stripped) mapped to its leading text, or
+    ``None`` when that text is empty or the element is marked nil. Text
+    between fields is ignored, including the stray ``/>`` that follows
+    ``<SidastaIslLogh .../>`` in the published sample data.
+    """
+
+    def __init__(self) -> None:
+        self._records: list[dict[str, Any]] = []
+        self._depth = 0
+        self._rec: dict[str, Any] | None = None
+        self._field = ""
+        self._attrib: dict[str, str] = {}
+        self._buf: list[str] = []
+        self._in_text = False
+
+    def start(self, tag: str, attrib: dict[str, str]) -> None:
+        self._depth += 1
+        depth = self._depth
+        if depth == 1:
+            if tag != "Einstaklingar":
+                raise ValueError("Unexpected root element; expected 'Einstaklingar'")
+        elif depth == 2:
+            self._rec = {} if tag == "Einstaklingur" else None
+        elif depth == 3:
+            if self._rec is not None:
+                self._field = tag.rpartition("}")[2]
+                self._attrib = attrib
+                self._buf = []
+                self._in_text = True
+        else:
+            # Only text before a field's first child counts, as with Element.text
+            self._in_text = False
+
+    def data(self, data: str) -> None:
+        if self._in_text:
+            self._buf.append(data)
+
+    def end(self, tag: str) -> None:
+        depth = self._depth
+        self._depth -= 1
+        if self._rec is None:
+            return
+        if depth == 3:
+            self._rec[self._field] = _text_or_none("".join(self._buf), self._attrib)
+            self._in_text = False
+        elif depth == 2:
+            self._records.append(self._rec)
+            self._rec = None
+
+    def pop_records(self) -> list[dict[str, Any]]:
+        """Return and forget the records completed so far."""
+        records, self._records = self._records, []
+        return records
+
+    def close(self) -> list[dict[str, Any]]:
+        return self.pop_records()
+
+
+_READ_SIZE = 64 * 1024
+
+
+def iter_einstaklingar_xml(path: str | Path) -> Iterator[dict[str, Any]]:
+    """Yield Einstaklingur records from the XML file as they are parsed.
+
+    The file is fed to the parser in fixed-size chunks, so memory use is
+    bounded by the read buffer rather than the file size, whether or not
+    the XML is split into lines. Errors (missing file, wrong root element,
+    malformed XML) are raised during iteration.
+    """
     path = Path(path)
-    xml_text = _read_text(path)
-    xml_text = _sanitize_known_issues(xml_text)
-    root = _xml_fromstring(xml_text)
-    if root.tag != "Einstaklingar":
-        raise ValueError("Unexpected root element; expected 'Einstaklingar'")
-    records: list[dict[str, Any]] = []
-    for child in root.findall("Einstaklingur"):
-        rec: dict[str, Any] = {}
-        for field in list(child):
-            # Strip namespace if any
-            tag = field.tag.split("}")[-1] if "}" in field.tag else field.tag
-            rec[tag] = _text_or_none(field)
-        records.append(rec)
-    return records
+    target = _EinstaklingarTarget()
+    parser = _XMLParser(target=target)
+    with path.open(encoding="utf-8") as f:
+        while True:
+            chunk = f.read(_READ_SIZE)
+            if not chunk:
+                break
+            parser.feed(chunk)
+            yield from target.pop_records()
+    yield from parser.close()
+
+
+def parse_einstaklingar_xml(path: str | Path) -> list[dict[str, Any]]:
+    return list(iter_einstaklingar_xml(path))
 
 
 def _to_iso_date(d: date) -> str:
     return d.isoformat()
 
 
-def validate_records(records: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    out: list[dict[str, Any]] = []
+class RecordValidation(TypedDict):
+    """Validation metadata attached to each record under ``"validation"``.
+
+    ``entity_type`` is ``"individual"`` or ``"company"`` and ``birth_date``
+    an ISO date string; both are None when the kennitala is not valid.
+    """
+
+    relaxed: bool
+    strict: bool
+    is_dataset: bool
+    entity_type: str | None
+    birth_date: str | None
+
+
+def _validate_kennitala(kt: str) -> RecordValidation:
+    # Normalize and decode once per value instead of once per predicate;
+    # the results match is_valid/is_dataset_id/is_company/is_personal/parse.
+    try:
+        digits = normalize(kt)
+    except (TypeError, ValueError):
+        digits = ""
+    birth, company, checksum_ok = None, False, False
+    is_dataset = False
+    if len(digits) == 10:
+        birth, company, checksum_ok = _full_parse(digits)
+        is_dataset = digits[6:8] in ("14", "15")
+    if birth is None:
+        return {
+            "relaxed": False,
+            "strict": False,
+            "is_dataset": is_dataset,
+            "entity_type": None,
+            "birth_date": None,
+        }
+    return {
+        "relaxed": True,
+        "strict": checksum_ok,
+        "is_dataset": is_dataset,
+        "entity_type": "company" if company else "individual",
+        "birth_date": _to_iso_date(birth),
+    }
+
+
+def iter_validate_records(records: Iterable[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+    """Yield a copy of each record with a ``"validation"`` entry added.
+
+    The ``"validation"`` value is a :class:`RecordValidation`; the other
+    keys are the record's own fields, which vary with the input, hence the
+    ``dict[str, Any]`` return type.
+    """
     for rec in records:
         kt = (rec.get("Kennitala") or "").strip()
-        v_relaxed = is_valid(kt, enforce_checksum=False)
-        v_strict = is_valid(kt, enforce_checksum=True)
-        ds = is_dataset_id(kt)
-        entity = (
-            "company" if is_company(kt) else ("individual" if is_personal(kt) else None)
-        )
-        birth_iso: str | None = None
-        if v_relaxed:
-            try:
-                info = parse(kt, enforce_checksum=False)
-                birth_iso = _to_iso_date(info.birth_date)
-            except Exception:
-                birth_iso = None
-        rec_out = dict(rec)
-        rec_out["validation"] = {
-            "relaxed": v_relaxed,
-            "strict": v_strict,
-            "is_dataset": ds,
-            "entity_type": entity,
-            "birth_date": birth_iso,
-        }
-        out.append(rec_out)
-    return out
+        yield {**rec, "validation": _validate_kennitala(kt)}
+
+
+def validate_records(records: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Return copies of the records, each with a ``"validation"`` entry.
+
+    See :func:`iter_validate_records`; ``rec["validation"]`` is a
+    :class:`RecordValidation`.
+    """
+    return list(iter_validate_records(records))
+
+
+def _mask_records(records: Iterable[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+    for rec in records:
+        kt = rec.get("Kennitala", "")
+        try:
+            rec["Kennitala"] = mask(kt)
+        except ValueError:
+            pass  # leave invalid/short values as-is
+        yield rec
+
+
+def _dumps(obj: Any, *, indent: bool) -> bytes:
+    # orjson and the stdlib fallback produce byte-identical output
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class _BytesWriter(Protocol):
+    def write(self, data: bytes, /) -> Any: ...
+
+
+class _TextStreamWriter:
+    """Bytes-accepting adapter over a text stream without a ``buffer``.
+
+    Covers stdout replacements such as ``io.StringIO`` under
+    ``contextlib.redirect_stdout`` or notebook streams. ``_dumps`` emits
+    whole JSON values, so each chunk decodes on its own.
+    """
+
+    def __init__(self, f: TextIO) -> None:
+        self._f = f
+
+    def write(self, data: bytes) -> int:
+        return self._f.write(data.decode("utf-8"))
+
+
+def _write_json(
+    records: Iterable[dict[str, Any]], f: _BytesWriter, *, ndjson: bool
+) -> None:
+    if ndjson:
+        for rec in records:
+            f.write(_dumps(rec, indent=False))
+            f.write(b"\n")
+        return
+    # Written one record at a time so the whole document is never held in
+    # memory; the bytes match dumping {"Einstaklingar": records} at indent=2.
+    f.write(b'{\n  "Einstaklingar": [')
+    empty = True
+    for rec in records:
+        f.write(b"\n    " if empty else b",\n    ")
+        f.write(_dumps(rec, indent=True).replace(b"\n", b"\n    "))
+        empty = False
+    f.write(b"]\n}" if empty else b"\n  ]\n}")
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -114,26 +286,40 @@ def main(argv: list[str] | None = None) -> int:
         "--mask", action="store_true", default=False,
         help="Mask kennitala values in output to prevent PII exposure",
     )
+    p.add_argument(
+        "--ndjson", action="store_true", default=False,
+        help="Write newline-delimited JSON, one record per line",
+    )
     args = p.parse_args(argv)
 
-    records = parse_einstaklingar_xml(args.xml)
-    validated = validate_records(records)
+    # Parse, validate, mask and write one record at a time
+    validated = iter_validate_records(iter_einstaklingar_xml(args.xml))
     if args.mask:
-        for rec in validated:
-            kt = rec.get("Kennitala", "")
-            try:
-                rec["Kennitala"] = mask(kt)
-            except ValueError:
-                pass  # leave invalid/short values as-is
+        validated = _mask_records(validated)
     if args.out:
         out_path = Path(args.out)
-        out_path.write_text(
-            json.dumps({"Einstaklingar": validated}, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+        # Input errors only surface while streaming, so write beside the
+        # target and move into place on success; a failed run leaves an
+        # existing output file untouched.
+        tmp_path = out_path.with_name(f".{out_path.name}.tmp")
+        try:
+            with tmp_path.open("wb") as f:
+                _write_json(validated, f, ndjson=args.ndjson)
+            os.replace(tmp_path, out_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
         print(f"Wrote {out_path}")
     else:
-        print(json.dumps({"Einstaklingar": validated}, ensure_ascii=False, indent=2))
+        # Bypass print() so the document is not built as one string first;
+        # text-only stdout replacements get the same bytes decoded.
+        sys.stdout.flush()
+        buffer = getattr(sys.stdout, "buffer", None)
+        out = buffer if buffer is not None else _TextStreamWriter(sys.stdout)
+        _write_json(validated, out, ndjson=args.ndjson)
+        if not args.ndjson:
+            out.write(b"\n")
+        sys.stdout.flush()
     return 0
 
 
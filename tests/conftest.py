@@ -0,0 +1,27 @@
+from pathlib import Path
+
+import pytest
+
+from ice_ken.loaders import parse_einstaklingar_xml
+
+
+SAMPLE_XML = (
+    Path(__file__).resolve().parents[1]
+    / "data"
+    / "Thjordska-Gervigogn-VartolulausarKennitolur.xml"
+)
+
+
+@pytest.fixture(scope="session")
+def sample_xml():
+    """Path to the bundled sample Einstaklingar XML file."""
+    return SAMPLE_XML
+
+
+@pytest.fixture(scope="session")
+def sample_records(sample_xml):
+    """Records parsed once per session from the bundled sample XML.
+
+    Shared between tests, so treat the list and its dicts as read-only.
+    """
+    return parse_einstaklingar_xml(sample_xml)
@@ -1,16 +1,17 @@
-from pathlib import Path
-
 import pytest
 
-from ice_ken.loaders import parse_einstaklingar_xml, validate_records, main
-
-
-REPO_ROOT = Path(__file__).resolve().parents[1]
-SAMPLE_XML = REPO_ROOT / "data" / "Thjordska-Gervigogn-VartolulausarKennitolur.xml"
+from ice_ken.loaders import (
+    RecordValidation,
+    iter_einstaklingar_xml,
+    iter_validate_records,
+    parse_einstaklingar_xml,
+    validate_records,
+    main,
+)
 
 
-def test_parse_and_validate_sample_xml():
-    records = parse_einstaklingar_xml(SAMPLE_XML)
+def test_parse_and_validate_sample_xml(sample_records):
+    records = sample_records
     # Expect 6 records per the sample file
     assert isinstance(records, list)
     assert len(records) == 6
@@ -18,16 +19,48 @@ def test_parse_and_validate_sample_xml():
     validated = validate_records(records)
     assert len(validated) == 6
 
-    for rec in validated:
-        kt = rec.get("Kennitala")
-        val = rec.get("validation", {})
-        assert val.get("relaxed") is True
-        # In this sample file, kennitalas are without checksum; strict should be False
-        assert val.get("strict") is False
-        # dataset marker (14/15 in positions 7–8) not used in this file
-        assert val.get("is_dataset") is False
-        # birth_date parsed from kennitala should be present
-        assert val.get("birth_date") is not None
+    # One comparison per attribute; a failure shows which records diverge
+    vals = [rec.get("validation", {}) for rec in validated]
+    n = len(vals)
+    assert [v.get("relaxed") for v in vals] == [True] * n
+    # In this sample file, kennitalas are without checksum; strict should be False
+    assert [v.get("strict") for v in vals] == [False] * n
+    # dataset marker (14/15 in positions 7–8) not used in this file
+    assert [v.get("is_dataset") for v in vals] == [False] * n
+    # birth_date parsed from kennitala should be present
+    assert [v.get("birth_date") is not None for v in vals] == [True] * n
+
+
+def test_iter_variants_match_list_variants(sample_records, sample_xml):
+    records = sample_records
+    it = iter_einstaklingar_xml(sample_xml)
+    assert not isinstance(it, list)
+    assert list(it) == records
+    validated = iter_validate_records(iter(records))
+    assert not isinstance(validated, list)
+    assert list(validated) == validate_records(records)
+
+
+def test_single_line_xml_parsed_in_chunks(tmp_path, monkeypatch):
+    import ice_ken.loaders as loaders
+
+    # Minified input with the sample's stray "/>"; tiny reads split tags
+    record = (
+        "<Einstaklingur><Kennitala>1201603389</Kennitala>"
+        '<SidastaIslLogh xsi:nil="true" />/><Nafn>Jón</Nafn></Einstaklingur>'
+    )
+    xml_file = tmp_path / "minified.xml"
+    xml_file.write_text(
+        '<Einstaklingar xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">'
+        + record * 50
+        + "</Einstaklingar>",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(loaders, "_READ_SIZE", 7)
+    it = iter_einstaklingar_xml(xml_file)
+    first = next(it)
+    assert first == {"Kennitala": "1201603389", "SidastaIslLogh": None, "Nafn": "Jón"}
+    assert [first, *it] == [first] * 50
 
 
 def test_wrong_root_element(tmp_path):
@@ -76,14 +109,22 @@ def test_nil_attribute_yields_none(tmp_path):
     assert records[0]["Nafn"] is None
 
 
+def test_validation_matches_record_validation_schema(sample_records):
+    keys = set(RecordValidation.__annotations__)
+    for rec in validate_records(sample_records + [{"Kennitala": "invalid"}]):
+        assert set(rec["validation"]) == keys
+
+
 def test_validate_records_with_invalid_kennitala():
-    records = [{"Kennitala": "invalid"}, {"Kennitala": ""}]
+    # "123456149" is too short despite "14" in positions 7-8
+    records = [{"Kennitala": "invalid"}, {"Kennitala": ""}, {"Kennitala": "123456149"}]
     validated = validate_records(records)
-    assert len(validated) == 2
+    assert len(validated) == 3
     for rec in validated:
         val = rec["validation"]
         assert val["relaxed"] is False
         assert val["strict"] is False
+        assert val["is_dataset"] is False
         assert val["entity_type"] is None
         assert val["birth_date"] is None
 
@@ -100,17 +141,17 @@ def test_malformed_xml_raises(tmp_path):
         parse_einstaklingar_xml(xml_file)
 
 
-def test_main_stdout(capsys):
-    ret = main([str(SAMPLE_XML)])
+def test_main_stdout(capsys, sample_xml):
+    ret = main([str(sample_xml)])
     assert ret == 0
     captured = capsys.readouterr()
     assert '"Einstaklingar"' in captured.out
     assert '"validation"' in captured.out
 
 
-def test_main_output_file(tmp_path):
+def test_main_output_file(tmp_path, sample_xml):
     out_file = tmp_path / "out.json"
-    ret = main([str(SAMPLE_XML), "--out", str(out_file)])
+    ret = main([str(sample_xml), "--out", str(out_file)])
     assert ret == 0
     assert out_file.exists()
     import json
@@ -119,9 +160,95 @@ def test_main_output_file(tmp_path):
     assert len(data["Einstaklingar"]) == 6
 
 
-def test_main_mask_flag(capsys):
-    ret = main([str(SAMPLE_XML), "--mask"])
+@pytest.mark.parametrize("xml_text", [None, "<Einstaklingar><broken"])
+def test_main_failed_run_keeps_existing_output(tmp_path, xml_text):
+    xml_file = tmp_path / "in.xml"
+    if xml_text is not None:
+        xml_file.write_text(xml_text, encoding="utf-8")
+    out_file = tmp_path / "out.json"
+    out_file.write_text("previous", encoding="utf-8")
+    with pytest.raises(Exception):
+        main([str(xml_file), "--out", str(out_file)])
+    assert out_file.read_text(encoding="utf-8") == "previous"
+    assert list(tmp_path.glob("*.tmp")) == []  # temp file cleaned up
+
+
+@pytest.mark.parametrize("ndjson", [False, True])
+def test_main_stdout_without_buffer(capsys, sample_xml, ndjson):
+    import contextlib
+    import io
+
+    extra = ["--ndjson"] if ndjson else []
+    assert main([str(sample_xml), *extra]) == 0
+    expected = capsys.readouterr().out
+    text_out = io.StringIO()
+    with contextlib.redirect_stdout(text_out):
+        assert main([str(sample_xml), *extra]) == 0
+    assert text_out.getvalue() == expected
+
+
+def test_main_mask_flag(capsys, sample_xml):
+    ret = main([str(sample_xml), "--mask"])
     assert ret == 0
     captured = capsys.readouterr()
     # Masked output should contain asterisks and no full 10-digit kennitalas
     assert "******" in captured.out
+
+
+def test_main_ndjson_output_file(tmp_path, sample_xml):
+    out_file = tmp_path / "out.ndjson"
+    ret = main([str(sample_xml), "--out", str(out_file), "--ndjson"])
+    assert ret == 0
+    import json
+    lines = out_file.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 6
+    for line in lines:
+        rec = json.loads(line)
+        assert "Kennitala" in rec
+        assert rec["validation"]["relaxed"] is True
+
+
+def test_main_ndjson_stdout(capsys, sample_xml):
+    ret = main([str(sample_xml), "--ndjson"])
+    assert ret == 0
+    captured = capsys.readouterr()
+    assert len(captured.out.splitlines()) == 6
+    assert '"Einstaklingar"' not in captured.out
+
+
+@pytest.mark.parametrize("ndjson", [False, True])
+def test_main_orjson_output_matches_stdlib_json(
+    tmp_path, monkeypatch, ndjson, sample_xml
+):
+    orjson = pytest.importorskip("orjson")
+    import ice_ken.loaders as loaders
+
+    extra = ["--ndjson"] if ndjson else []
+    orjson_out = tmp_path / "orjson.json"
+    stdlib_out = tmp_path / "stdlib.json"
+    monkeypatch.setattr(loaders, "orjson", orjson)
+    assert main([str(sample_xml), "--out", str(orjson_out), *extra]) == 0
+    monkeypatch.setattr(loaders, "orjson", None)
+    assert main([str(sample_xml), "--out", str(stdlib_out), *extra]) == 0
+    assert orjson_out.read_bytes() == stdlib_out.read_bytes()
+
+
+@pytest.mark.parametrize("xml_text", [None, "<Einstaklingar/>"])
+def test_main_output_matches_json_dumps(tmp_path, capsys, xml_text, sample_xml):
+    import json
+
+    xml_file = sample_xml
+    if xml_text is not None:
+        xml_file = tmp_path / "in.xml"
+        xml_file.write_text(xml_text, encoding="utf-8")
+    expected = json.dumps(
+        {"Einstaklingar": validate_records(parse_einstaklingar_xml(xml_file))},
+        ensure_ascii=False,
+        indent=2,
+    )
+    out_file = tmp_path / "out.json"
+    assert main([str(xml_file), "--out", str(out_file)]) == 0
+    assert out_file.read_text(encoding="utf-8") == expected
+    capsys.readouterr()
+    assert main([str(xml_file)]) == 0
+    assert capsys.readouterr().out == expected + "\n"